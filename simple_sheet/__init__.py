@@ -5,9 +5,9 @@
 
 from __future__ import annotations
 
+import functools
 import io
 import sys
-from pathlib import Path
 from typing import List, Optional, Sequence
 
 # Windows環境で標準出力をUTF-8に設定（標準のprint()で日本語が使えるようにする）
@@ -18,31 +18,6 @@ if sys.platform == "win32":
     except (AttributeError, OSError):
         pass  # バッファが使えない環境ではスキップ
 
-# .env ファイルを自動読み込み（存在すれば）
-try:
-    from dotenv import load_dotenv
-
-    # 複数のパターンで .env を探す
-    candidates = [
-        Path.cwd() / ".env",
-        Path.cwd() / "src" / ".env",
-        Path(__file__).parent.parent / ".env",
-        Path(__file__).parent.parent / "src" / ".env",
-    ]
-
-    loaded = False
-    for env_path in candidates:
-        if env_path.exists():
-            load_dotenv(env_path)
-            loaded = True
-            break
-
-    # どれも見つからなければデフォルト動作
-    if not loaded:
-        load_dotenv()
-except ImportError:
-    pass  # python-dotenv がなければスキップ
-
 from .core import (
     Cell,
     CsvSheet,
@@ -73,34 +48,38 @@ __all__ = [
 
 # --- モジュールレベルの簡易プロキシ ----------------------------------------
 
-_default_sheet = SimpleSheet()
+
+@functools.cache
+def _get_default_sheet() -> SimpleSheet:
+    # import 時ではなく初回利用時に作成する
+    return SimpleSheet()
 
 
 def get_cell(row: int, col: int) -> Cell:
     """デフォルトシートからセルを取得する。"""
-    return _default_sheet.get_cell(row, col)
+    return _get_default_sheet().get_cell(row, col)
 
 
 def set_cell(row: int, col: int, value: str) -> None:
     """デフォルトシートの指定セルに値を設定する。"""
-    _default_sheet.set_cell(row, col, value)
+    _get_default_sheet().set_cell(row, col, value)
 
 
 def append_row(values: Sequence[str]) -> int:
     """デフォルトシート末尾に行を追加する。"""
-    return _default_sheet.append_row(values)
+    return _get_default_sheet().append_row(values)
 
 
 def get_row(row: int) -> List[Optional[str]]:
     """デフォルトシートの指定行を取得する。"""
-    return _default_sheet.get_row(row)
+    return _get_default_sheet().get_row(row)
 
 
 def get_max_row() -> int:
     """デフォルトシートの最大行番号を返す。"""
-    return _default_sheet.get_max_row()
+    return _get_default_sheet().get_max_row()
 
 
 def clear_sheet() -> None:
     """デフォルトシートをクリアする。"""
-    _default_sheet.clear()
+    _get_default_sheet().clear()
@@ -3,15 +3,19 @@
 from __future__ import annotations
 
 import csv
+import functools
 import io
 import os
+import shutil
 import sys
+import tempfile
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from unicodedata import east_asian_width
 
-from .utils import resolve_path
+from .utils import _ensure_dotenv, resolve_path
 
 
 if TYPE_CHECKING:
@@ -28,6 +32,32 @@ __all__ = [
 ]
 
 
+# CSV 読み書き時のバッファサイズ（既定の 8 KiB では大きなシートで read/write 回数が増える）
+_CSV_BUFFER_SIZE = 1 << 20
+
+# 表示幅 2 として扱う East Asian Width の分類（○ などの曖昧幅 A も全角扱い）
+_WIDE_EAW = frozenset(("W", "F", "A"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _display_width(text: str) -> int:
+    """日本語文字を考慮した表示幅（全角=2、半角=1）を返す。"""
+    # ID や日付などの ASCII のみのセルは文字数がそのまま表示幅になる
+    if text.isascii():
+        return len(text)
+    # 1 文字ずつの Python ループを避け、全角文字の数だけ文字数に足す
+    return len(text) + sum(map(_WIDE_EAW.__contains__, map(east_asian_width, text)))
+
+
+def _empty_to_none(rows: Iterable[List[str]]) -> List[List[Optional[str]]]:
+    """読み込んだ行の空文字を None に置き換える。"""
+    # 空セルのない行（"" in row は C 側で判定される）は元の行をそのまま使う
+    return [
+        row if "" not in row else [None if cell == "" else cell for cell in row]
+        for row in rows
+    ]
+
+
 class InvalidParameter(ValueError):
     """ユーザーから渡されたパラメータが不正な場合に投げる例外。"""
 
@@ -50,6 +80,8 @@ class SimpleSheet:
 
     def __init__(self) -> None:
         self._rows: List[List[Optional[str]]] = []
+        # 最大列数（get_max_column を毎回全行走査しないよう増分で管理する）
+        self._max_col = 0
 
     def set_cell(self, row: int, col: int, value: str) -> None:
         """指定セルに値を設定する。必要に応じて行・列を伸ばす。"""
@@ -58,7 +90,7 @@ class SimpleSheet:
         self._ensure_row(row)
         row_data = self._rows[row - 1]
         self._ensure_col(row_data, col)
-        row_data[col - 1] = str(value)
+        row_data[col - 1] = value if type(value) is str else str(value)
 
     def get_cell(self, row: int, col: int) -> Cell:
         """指定セルの値を返す。範囲外なら value=None の Cell を返す。"""
@@ -76,7 +108,8 @@ class SimpleSheet:
 
         if not values:
             raise InvalidParameter("values は 1 件以上必要です。")
-        self._rows.append([str(v) for v in values])
+        self._rows.append([v if type(v) is str else str(v) for v in values])
+        self._max_col = max(self._max_col, len(values))
         return len(self._rows)
 
     def get_row(self, row: int) -> List[Optional[str]]:
@@ -96,20 +129,15 @@ class SimpleSheet:
         """指定列をリストで返す。存在しない場合は空リスト。"""
 
         self._validate_positive(col, "col")
-        result = []
-        for row in self._rows:
-            if col <= len(row):
-                result.append(row[col - 1])
-            else:
-                result.append(None)
-        return result
+        if col > self._max_col:
+            return [None] * len(self._rows)
+        idx = col - 1
+        return [row[idx] if idx < len(row) else None for row in self._rows]
 
     def get_max_column(self) -> int:
         """現在使用されている最大列番号を返す。データがなければ 0。"""
 
-        if not self._rows:
-            return 0
-        return max(len(row) for row in self._rows)
+        return self._max_col
 
     def get_all_rows(self) -> List[List[Optional[str]]]:
         """シート全体を 2 次元配列で返す（表示・デバッグ用）。"""
@@ -120,6 +148,7 @@ class SimpleSheet:
         """シートを空に戻す。"""
 
         self._rows.clear()
+        self._max_col = 0
 
     def save_to_csv(self, path: Optional[str | Path] = None) -> Path:
         """シートの内容をCSVファイルとして保存する。
@@ -143,10 +172,9 @@ class SimpleSheet:
 
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with save_path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            for row in self._rows:
-                writer.writerow([cell if cell is not None else "" for cell in row])
+        with save_path.open("w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE) as f:
+            # csv.writer は None を空文字として書き出すので、そのまま writerows に渡せる
+            csv.writer(f).writerows(self._rows)
 
         return save_path
 
@@ -156,40 +184,41 @@ class SimpleSheet:
             print("(empty sheet)")
             return
 
-        # 各列の最大幅を計算
-        col_widths = []
-        max_cols = max(len(row) for row in self._rows) if self._rows else 0
-
-        for col_idx in range(max_cols):
-            max_width = 0
-            for row in self._rows:
-                if col_idx < len(row) and row[col_idx] is not None:
-                    # 日本語文字を考慮した幅計算（全角=2、半角=1）
-                    width = sum(2 if ord(c) > 0x7F else 1 for c in str(row[col_idx]))
-                    max_width = max(max_width, width)
-            col_widths.append(max_width)
+        # セルを文字列化し、各セルの表示幅と各列の最大幅を 1 回の走査で求める
+        max_cols = self._max_col
+        rendered = [[str(v) if v is not None else "" for v in row] for row in self._rows]
+        widths = [[_display_width(v) for v in row] for row in rendered]
+        col_widths = [0] * max_cols
+        for row_widths in widths:
+            for col_idx, width in enumerate(row_widths):
+                if width > col_widths[col_idx]:
+                    col_widths[col_idx] = width
 
         # ヘッダー区切り線
         separator = "+" + "+".join("-" * (w + 2) for w in col_widths) + "+"
 
-        # 行を表示
-        print(separator)
-        for row_idx, row in enumerate(self._rows):
+        # 行を組み立てて最後にまとめて表示
+        out = [separator]
+        for row_idx, (row, row_widths) in enumerate(zip(rendered, widths)):
             cells = []
             for col_idx in range(max_cols):
-                cell_value = row[col_idx] if col_idx < len(row) and row[col_idx] is not None else ""
+                if col_idx < len(row):
+                    cell_value, current_width = row[col_idx], row_widths[col_idx]
+                else:
+                    cell_value, current_width = "", 0
                 # 日本語文字を考慮したパディング
-                current_width = sum(2 if ord(c) > 0x7F else 1 for c in str(cell_value))
                 padding = col_widths[col_idx] - current_width
                 cells.append(f" {cell_value}{' ' * padding} ")
 
-            print("|" + "|".join(cells) + "|")
+            out.append("|" + "|".join(cells) + "|")
 
             # 最初の行の後に区切り線（ヘッダー扱い）
             if row_idx == 0:
-                print(separator)
+                out.append(separator)
 
-        print(separator)
+        out.append(separator)
+        # 1 回の print でまとめて出力する（行ごとの書き込みを避ける）
+        print("\n".join(out))
 
     # --- 内部ユーティリティ ------------------------------------------------
 
@@ -203,55 +232,142 @@ class SimpleSheet:
         self._validate_positive(col, "col")
 
     def _ensure_row(self, row: int) -> None:
-        while len(self._rows) < row:
-            self._rows.append([])
+        needed = row - len(self._rows)
+        if needed > 0:
+            self._rows.extend([] for _ in range(needed))
 
-    @staticmethod
-    def _ensure_col(row_data: List[Optional[str]], col: int) -> None:
-        while len(row_data) < col:
-            row_data.append(None)
+    def _ensure_col(self, row_data: List[Optional[str]], col: int) -> None:
+        needed = col - len(row_data)
+        if needed > 0:
+            row_data.extend([None] * needed)
+        self._max_col = max(self._max_col, col)
 
 
 class CsvSheet(SimpleSheet):
-    """CSV ファイルをストレージとして扱うシート。"""
+    """CSV ファイルをストレージとして扱うシート。
+
+    通常は変更のたびにファイルへ書き出すが、``with sheet:`` ブロック内では
+    書き込みをまとめ、ブロックを抜けるときに 1 回だけ書き出す。
+
+    Examples
+    --------
+    >>> with sheet:
+    ...     for row in range(2, 100):
+    ...         sheet.set_cell(row, 2, "○")
+    """
 
     def __init__(self, path: str | Path) -> None:
         super().__init__()
         self._path = Path(path)
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._dirty = False
+        self._autoflush = True
+        # ファイルに書き出し済みの行数と、既存行の書き換えが必要かどうか
+        self._persisted_rows = 0
+        self._needs_rewrite = False
         self._load_from_csv()
 
+    def __enter__(self) -> "CsvSheet":
+        self._autoflush = False
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._autoflush = True
+        self.flush()
+
     def set_cell(self, row: int, col: int, value: str) -> None:
         super().set_cell(row, col, value)
-        self._flush_to_csv()
+        self._needs_rewrite = True
+        self._mark_dirty()
 
     def append_row(self, values: Sequence[str]) -> int:
         row_no = super().append_row(values)
-        self._flush_to_csv()
+        self._mark_dirty()
         return row_no
 
     def clear(self) -> None:
         super().clear()
-        self._flush_to_csv()
+        self._needs_rewrite = True
+        self._mark_dirty()
+
+    def flush(self) -> None:
+        """未保存の変更があれば CSV ファイルへ書き出す。
+
+        行の追加だけであれば新しい行をファイル末尾に追記し、
+        既存行が変更されている場合はファイル全体を書き直す。
+        """
+
+        if not self._dirty:
+            return
+        if self._needs_rewrite:
+            self._flush_to_csv()
+        else:
+            self._append_new_rows_to_csv()
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._autoflush:
+            self.flush()
 
     def _load_from_csv(self) -> None:
         if not self._path.exists():
             return
-        with self._path.open(newline="", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            self._rows = [[cell if cell != "" else None for cell in row] for row in reader]
+        with self._path.open(newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE) as f:
+            self._rows = _empty_to_none(csv.reader(f))
+        self._max_col = max((len(row) for row in self._rows), default=0)
+        self._persisted_rows = len(self._rows)
+        # 末尾に改行がないファイルへ追記すると最終行と連結されるため、初回は書き直す
+        self._needs_rewrite = not self._ends_with_newline()
+
+    def _ends_with_newline(self) -> bool:
+        with self._path.open("rb") as f:
+            if f.seek(0, os.SEEK_END) == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) in (b"\n", b"\r")
 
     def _flush_to_csv(self) -> None:
-        with self._path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            for row in self._rows:
-                writer.writerow([cell if cell is not None else "" for cell in row])
+        # 一時ファイルに書いてから置き換え、途中で落ちても中途半端なファイルが残らないようにする。
+        # シンボリックリンクの場合はリンク先を置き換える
+        target = self._path.resolve()
+        f = tempfile.NamedTemporaryFile(
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=_CSV_BUFFER_SIZE,
+            dir=target.parent,
+            prefix=f"{target.name}.",
+            suffix=".tmp",
+            delete=False,
+        )
+        tmp_path = Path(f.name)
+        try:
+            with f:
+                csv.writer(f).writerows(self._rows)
+            # mkstemp の一時ファイルは 0600 なので、元ファイル（なければ umask に従う新規ファイル）の権限に揃える
+            target.touch(exist_ok=True)
+            shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._persisted_rows = len(self._rows)
+        self._needs_rewrite = False
+        self._dirty = False
+
+    def _append_new_rows_to_csv(self) -> None:
+        with self._path.open("a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(self._rows[self._persisted_rows :])
+        self._persisted_rows = len(self._rows)
+        self._dirty = False
 
 
 class GoogleSheet(SimpleSheet):
     """Google スプレッドシートをバックエンドに使うシート。
 
     サービスアカウントの鍵を使って認証する。シートへの書き込みは都度 API に反映する。
+    ``with sheet:`` ブロック内では書き込みをため込み、ブロックを抜けるときに
+    ``batch_update`` でまとめて反映する（API 呼び出しが 1 セル 1 回にならない）。
     """
 
     def __init__(
@@ -261,6 +377,7 @@ class GoogleSheet(SimpleSheet):
         credentials_path: Optional[str | Path] = None,
     ) -> None:
         super().__init__()
+        _ensure_dotenv()
         try:
             import gspread
         except ImportError as exc:
@@ -273,25 +390,85 @@ class GoogleSheet(SimpleSheet):
         self._creds = self._build_credentials(credentials_path)
         self._client = gspread.authorize(self._creds)
         self._worksheet = self._client.open_by_key(spreadsheet_id).worksheet(worksheet)
+        self._autoflush = True
+        self._pending_updates: List[Tuple[int, int, str]] = []
+        # まだ反映していない追加行（行番号と値）
+        self._pending_rows: List[Tuple[int, List[str]]] = []
         self._load_from_gsheet()
 
+    def __enter__(self) -> "GoogleSheet":
+        self._autoflush = False
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._autoflush = True
+        self.flush()
+
     def set_cell(self, row: int, col: int, value: str) -> None:
         super().set_cell(row, col, value)
-        self._worksheet.update_cell(row, col, str(value))
+        # 文字列化済みの値を使う
+        value = self._rows[row - 1][col - 1]
+        if self._autoflush:
+            self._worksheet.update_cell(row, col, value)
+        else:
+            self._pending_updates.append((row, col, value))
 
     def append_row(self, values: Sequence[str]) -> int:
         row_no = super().append_row(values)
-        self._worksheet.append_row([str(v) for v in values], value_input_option="RAW")
+        # 文字列化済みの値を使う
+        str_values = list(self._rows[row_no - 1])
+        if self._autoflush:
+            self._worksheet.append_row(str_values, value_input_option="RAW")
+        else:
+            self._pending_rows.append((row_no, str_values))
         return row_no
 
     def clear(self) -> None:
         super().clear()
+        self._pending_updates.clear()
+        self._pending_rows.clear()
         self._worksheet.clear()
 
+    def flush(self) -> None:
+        """ため込んだ書き込みを Google スプレッドシートへまとめて反映する。
+
+        追加行を先に書き込み、その後でセル単位の更新を反映する
+        （追加した行に対する ``set_cell`` も正しく上書きされる）。
+        """
+
+        from gspread.utils import rowcol_to_a1
+
+        if self._pending_rows:
+            # 行番号を明示して書き込む。set_cell で間に行が増えていることがあるので、
+            # 連続する行ごとに 1 つの範囲にまとめる
+            blocks: List[Tuple[int, List[List[str]]]] = []
+            for row_no, values in self._pending_rows:
+                if blocks and blocks[-1][0] + len(blocks[-1][1]) == row_no:
+                    blocks[-1][1].append(values)
+                else:
+                    blocks.append((row_no, [values]))
+            self._worksheet.batch_update(
+                [
+                    {"range": rowcol_to_a1(start, 1), "values": rows}
+                    for start, rows in blocks
+                ],
+                value_input_option="RAW",
+            )
+            self._pending_rows = []
+        if self._pending_updates:
+            self._worksheet.batch_update(
+                [
+                    {"range": rowcol_to_a1(row, col), "values": [[value]]}
+                    for row, col, value in self._pending_updates
+                ],
+                value_input_option="USER_ENTERED",
+            )
+            self._pending_updates = []
+
     def _load_from_gsheet(self) -> None:
         # 既存値をすべて読み込み、空文字は None に揃える
-        values = self._worksheet.get_all_values()
-        self._rows = [[cell if cell != "" else None for cell in row] for row in values]
+        self._rows = _empty_to_none(self._worksheet.get_all_values())
+        self._max_col = max((len(row) for row in self._rows), default=0)
 
     @staticmethod
     def _build_credentials(credentials_path: Optional[str | Path]):
@@ -372,6 +549,7 @@ def open_sheet(
         return CsvSheet(csv_path)
     else:
         # オンライン: Google Sheets
+        _ensure_dotenv()
         spreadsheet_id = spreadsheet_id or os.environ.get("GOOGLE_SPREADSHEET_ID")
         if spreadsheet_id is None:
             raise InvalidParameter(
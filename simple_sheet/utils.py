@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import inspect
+import functools
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Any
@@ -31,17 +32,67 @@ def resolve_path(path: str | Path, stack_level: int = 1) -> Path:
     Path
         解決された絶対パス。
     """
-    resolved = Path(path)
+    # 絶対パスなら呼び出し元のフレームを調べる必要はない
+    if isinstance(path, Path):
+        if path.is_absolute():
+            return path
+    elif isinstance(path, str) and _is_absolute_str(path):
+        return _resolve_cached(path, "")
+
+    # inspect.stack() は全フレームの情報を組み立てるため、必要なフレームだけを直接取得する
+    caller_file = sys._getframe(stack_level + 1).f_code.co_filename
+    return _resolve_cached(os.fspath(path), caller_file)
+
+
+def _is_absolute_str(path: str) -> bool:
+    # Path を作らずに文字列の先頭だけで絶対パスか判定する
+    if os.name == "nt":
+        return path[1:3] in (":\\", ":/")
+    return path.startswith("/")
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cached(path_str: str, caller_file: str) -> Path:
+    # 同じ呼び出し元から同じパスを何度も解決することが多いのでキャッシュする
+    resolved = Path(path_str)
 
     if not resolved.is_absolute():
-        caller_frame = inspect.stack()[stack_level + 1]
-        caller_file = caller_frame.filename
         caller_dir = Path(caller_file).parent
         resolved = caller_dir / resolved
 
     return resolved
 
 
+@functools.cache
+def _ensure_dotenv() -> None:
+    """.env ファイルを読み込む（存在すれば）。
+
+    環境変数が必要になるのは Google Sheets を使うときだけなので、
+    import 時ではなくその時点で 1 回だけ呼び出す。
+    """
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return  # python-dotenv がなければスキップ
+
+    # 複数のパターンで .env を探す
+    package_root = Path(__file__).parent.parent
+    candidates = [
+        Path.cwd() / ".env",
+        Path.cwd() / "src" / ".env",
+        package_root / ".env",
+        package_root / "src" / ".env",
+    ]
+
+    for env_path in candidates:
+        if env_path.exists():
+            load_dotenv(env_path)
+            return
+
+    # どれも見つからなければデフォルト動作
+    load_dotenv()
+
+
 def load_json(path: str | Path) -> Any:
     """JSONファイルを読み込んで返す。
 
@@ -57,9 +108,15 @@ def load_json(path: str | Path) -> Any:
         JSONファイルの内容（dict, list など）。
     """
     json_path = resolve_path(path, stack_level=1)
+    st = json_path.stat()
+    # 呼び出し元が結果を書き換えても影響しないよう、毎回新しいオブジェクトを作る
+    return json.loads(_read_bytes_cached(str(json_path), st.st_mtime_ns, st.st_size))
+
 
-    with json_path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+@functools.lru_cache(maxsize=64)
+def _read_bytes_cached(path_str: str, mtime_ns: int, size: int) -> bytes:
+    # 更新時刻とサイズをキーに含め、ファイルが変わったら読み直す
+    return Path(path_str).read_bytes()
 
 
 def safe_print(*args, **kwargs) -> None:
@@ -1,14 +1,21 @@
 import sys
 from simple_sheet import open_sheet, load_json
 
-# ---- test code ----
-# student_id = sys.argv[1] if len(sys.argv) > 1 else None
-# now = datetime.datetime.strptime(sys.argv[2], "%Y-%m-%d %H:%M:%S") if len(sys.argv) > 2 else None
 
+def run(student_id=None, date=None):
+    # ---- test code ----
+    # now = datetime.datetime.strptime(date, "%Y-%m-%d %H:%M:%S") if date else None
 
-sheet = open_sheet(path="./sheets/attendance.csv")
-student_list = load_json("./sheets/student_list.json")
-print(student_list)
+    sheet = open_sheet(path="./sheets/attendance.csv")
+    student_list = load_json("./sheets/student_list.json")
+    print(student_list)
 
-sheet.set_cell(1, 1, "12月")
-sheet.display()
+    sheet.set_cell(1, 1, "12月")
+    sheet.display()
+
+
+if __name__ == "__main__":
+    run(
+        sys.argv[1] if len(sys.argv) > 1 else None,
+        sys.argv[2] if len(sys.argv) > 2 else None,
+    )
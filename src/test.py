@@ -1,16 +1,12 @@
-import subprocess
-import sys
-from pathlib import Path
+import traceback
 
+from main import run
 from simple_sheet import load_json
 
 # テストケースと学生リストを読み込み
 test_cases = load_json("./sheets/test_case.json")
 student_list = load_json("./sheets/student_list.json")
 
-# main.py のパス
-main_script = Path(__file__).parent / "main.py"
-
 print("=" * 50)
 print("Running tests for main.py")
 print("=" * 50)
@@ -26,19 +22,11 @@ for case_name, case_data in test_cases.items():
     print(f"  Date: {date}")
     print("-" * 30)
 
-    # main.py を実行（Windows環境でもUTF-8で出力を読み取る）
-    result = subprocess.run(
-        [sys.executable, str(main_script), student_id, date],
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-        errors="replace",
-    )
-
-    if result.stdout:
-        print(result.stdout, end="")
-    if result.stderr:
-        print(f"  [ERROR] {result.stderr}")
+    # main.py の run() を同じプロセス内で実行（ケースごとに Python を起動しない）
+    try:
+        run(student_id, date)
+    except Exception:
+        print(f"  [ERROR] {traceback.format_exc()}")
 
 print("=" * 50)
 print("All tests completed")